@@ -8,10 +8,15 @@ bl_info = {
     "category": "3D View",
 }
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import bpy
 import bmesh
+import numpy as np
+from bpy.app.handlers import persistent
 from bpy.types import Operator, AddonPreferences, Panel
-from bpy.props import BoolProperty, EnumProperty
+from bpy.props import BoolProperty, EnumProperty, IntProperty
 
 # Global state tracking dictionaries
 isolate_states = {
@@ -21,9 +26,12 @@ isolate_states = {
         'hidden_objects': [],  # Shared list of hidden objects across modes
         'hidden_bones': [],    # Shared list of hidden bones across modes
         'OBJECT': {'selected_objects': []},
-        'EDIT_MESH': {'selected_faces': [], 'selected_edges': [], 'selected_verts': []},
+        'EDIT_MESH': {'selected_faces': [], 'selected_edges': [], 'selected_verts': [], 'hidden_verts': []},
         'POSE': {'selected_bones': []},
-        'EDIT_ARMATURE': {'selected_bones': []}
+        'EDIT_ARMATURE': {'selected_bones': []},
+        'EDIT_CURVES': {'selected': {}, 'hidden': {}, 'selection_domains': {}, 'hide_domains': {}},
+        'EDIT_GREASE_PENCIL': {'selected': {}, 'hidden': {}, 'selection_domains': {}, 'hide_domains': {}},
+        'EDIT_LATTICE': {'selected': {}, 'hidden': {}, 'selection_domains': {}, 'hide_domains': {}}
     },
     # Global isolation states
     'GLOBAL': {
@@ -31,12 +39,223 @@ isolate_states = {
         'hidden_objects': [],  # Shared list of hidden objects across modes
         'hidden_bones': [],    # Shared list of hidden bones across modes
         'OBJECT': {'selected_objects': []},
-        'EDIT_MESH': {'selected_faces': [], 'selected_edges': [], 'selected_verts': []},
+        'EDIT_MESH': {'selected_faces': [], 'selected_edges': [], 'selected_verts': [], 'hidden_verts': []},
         'POSE': {'selected_bones': []},
-        'EDIT_ARMATURE': {'selected_bones': []}
+        'EDIT_ARMATURE': {'selected_bones': []},
+        'EDIT_CURVES': {'selected': {}, 'hidden': {}, 'selection_domains': {}, 'hide_domains': {}},
+        'EDIT_GREASE_PENCIL': {'selected': {}, 'hidden': {}, 'selection_domains': {}, 'hide_domains': {}},
+        'EDIT_LATTICE': {'selected': {}, 'hidden': {}, 'selection_domains': {}, 'hide_domains': {}}
     }
 }
 
+#----------------------------------------------------------------------------------
+# BACKGROUND INDEX POOL
+#----------------------------------------------------------------------------------
+index_pool = None          # Worker pool owned by the addon, created in register()
+isolate_indexes = {}       # Published indexes keyed by object name
+index_generations = {}     # Bumped whenever an object's edit data changes
+dirty_indexes = set()      # Objects waiting for a snapshot
+index_watched = set()      # Edit objects isolated this session, the only ones indexed
+index_self_updates = set() # Objects whose next depsgraph update is our own write-back
+INDEX_SNAPSHOT_DELAY = 0.25  # Idle seconds before dirty objects are snapshotted
+INDEX_MAX_VERTS = 250000   # Denser meshes are scanned at keypress instead
+_last_dirty_time = 0.0
+
+def build_mesh_index(generation, vert_select, vert_hide, edge_select, face_select):
+    """Compute the selection index of a mesh from raw select buffers (runs in the pool)
+    
+    The index lists are built here too, so the operator can store them as they are.
+    """
+    return {
+        'generation': generation,
+        'counts': (len(vert_select), len(edge_select), len(face_select)),
+        'selected_verts': np.flatnonzero(vert_select).tolist(),
+        'selected_edges': np.flatnonzero(edge_select).tolist(),
+        'selected_faces': np.flatnonzero(face_select).tolist(),
+        # Vertices an isolation would hide: unselected and not already hidden
+        'hidden_verts': np.flatnonzero(~vert_select & ~vert_hide).tolist(),
+    }
+
+def publish_index(name, future):
+    """Publish a finished index, unless the object changed while it was being built"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    index = future.result()
+    if index['generation'] == index_generations.get(name):
+        # Single dict assignment, so readers never see a half-built index
+        isolate_indexes[name] = index
+
+def isolation_can_enable():
+    """Whether the next isolation keypress could enable an isolation"""
+    return not (isolate_states['LOCAL']['active'] and isolate_states['GLOBAL']['active'])
+
+def mark_index_dirty(name):
+    """Invalidate the index of an object and schedule a new snapshot"""
+    global _last_dirty_time
+    index_generations[name] = index_generations.get(name, 0) + 1
+    dirty_indexes.add(name)
+    _last_dirty_time = time.monotonic()
+    if not isolation_can_enable():
+        return
+    if not bpy.app.timers.is_registered(snapshot_dirty_indexes):
+        bpy.app.timers.register(snapshot_dirty_indexes, first_interval=INDEX_SNAPSHOT_DELAY)
+
+def snapshot_dirty_indexes():
+    """Timer callback: snapshot raw arrays on the main thread and hand them to the pool"""
+    if index_pool is None:
+        dirty_indexes.clear()
+        return None
+    
+    # Wait until edits settle so snapshots don't run during interactive changes
+    idle = time.monotonic() - _last_dirty_time
+    if idle < INDEX_SNAPSHOT_DELAY:
+        return INDEX_SNAPSHOT_DELAY - idle
+    
+    for name in list(dirty_indexes):
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.type != 'MESH' or obj.mode != 'EDIT':
+            dirty_indexes.discard(name)
+            index_watched.discard(name)
+            isolate_indexes.pop(name, None)
+            continue
+        
+        # Nothing to precompute while every isolation is already active. Dense meshes
+        # stay dirty, the write-back below would cost more than the keypress scan.
+        if not isolation_can_enable() or len(obj.data.vertices) > INDEX_MAX_VERTS:
+            continue
+        dirty_indexes.discard(name)
+        
+        # Sync edit-mode data so foreach_get sees the current selection. This full
+        # write-back is the main cost of an index and stays on the main thread. It
+        # tags the object for an update that must not invalidate this snapshot.
+        obj.update_from_editmode()
+        index_self_updates.add(name)
+        mesh = obj.data
+        vert_select = np.empty(len(mesh.vertices), dtype=bool)
+        vert_hide = np.empty(len(mesh.vertices), dtype=bool)
+        edge_select = np.empty(len(mesh.edges), dtype=bool)
+        face_select = np.empty(len(mesh.polygons), dtype=bool)
+        mesh.vertices.foreach_get('select', vert_select)
+        mesh.vertices.foreach_get('hide', vert_hide)
+        mesh.edges.foreach_get('select', edge_select)
+        mesh.polygons.foreach_get('select', face_select)
+        
+        future = index_pool.submit(build_mesh_index, index_generations.get(name, 0),
+                                   vert_select, vert_hide, edge_select, face_select)
+        future.add_done_callback(lambda f, name=name: publish_index(name, f))
+    return None
+
+def get_ready_index(obj, bm):
+    """Return the published index of an object if it is current, otherwise None"""
+    name = obj.name
+    index = isolate_indexes.get(name)
+    if index is None or name in dirty_indexes:
+        return None
+    if index['generation'] != index_generations.get(name):
+        return None
+    if index['counts'] != (len(bm.verts), len(bm.edges), len(bm.faces)):
+        return None
+    
+    # Cheap check against the live selection, in case the depsgraph has not run yet
+    mesh = obj.data
+    selected_counts = (len(index['selected_verts']), len(index['selected_edges']), len(index['selected_faces']))
+    if selected_counts != (mesh.total_vert_sel, mesh.total_edge_sel, mesh.total_face_sel):
+        return None
+    return index
+
+@persistent
+def index_depsgraph_update(scene, depsgraph):
+    """Invalidate indexes of watched meshes edited since the last snapshot"""
+    if not index_watched:
+        return
+    
+    # Updates caused by our own write-back carry no user change
+    suppressed = set(index_self_updates)
+    index_self_updates.clear()
+    
+    for update in depsgraph.updates:
+        id_data = update.id
+        if isinstance(id_data, bpy.types.Object):
+            if id_data.name in index_watched and id_data.name not in suppressed:
+                mark_index_dirty(id_data.name)
+        elif isinstance(id_data, bpy.types.Mesh):
+            # Edit-mode selection changes only tag the mesh datablock
+            for name in list(index_watched):
+                if name in suppressed:
+                    continue
+                obj = bpy.data.objects.get(name)
+                if obj is not None and obj.data is not None and obj.data.name == id_data.name:
+                    mark_index_dirty(name)
+
+def store_mesh_selection(obj, mode_state):
+    """Store the selected vertex, edge and face indices of an edit mesh"""
+    bm = bmesh.from_edit_mesh(obj.data)
+    index = get_ready_index(obj, bm)
+    
+    # Isolation is used on this mesh, keep its index precomputed from now on
+    index_watched.add(obj.name)
+    
+    if index is not None:
+        # Use the index precomputed in the background
+        mode_state['selected_verts'] = index['selected_verts']
+        mode_state['selected_edges'] = index['selected_edges']
+        mode_state['selected_faces'] = index['selected_faces']
+        mode_state['hidden_verts'] = index['hidden_verts']
+    else:
+        # No current index, compute it synchronously
+        mode_state['selected_verts'] = [v.index for v in bm.verts if v.select]
+        mode_state['selected_edges'] = [e.index for e in bm.edges if e.select]
+        mode_state['selected_faces'] = [f.index for f in bm.faces if f.select]
+        mode_state['hidden_verts'] = [v.index for v in bm.verts if not v.select and not v.hide]
+
+def deselect_objects(context):
+    """Deselect all objects without an operator, so no undo step is pushed"""
+    for obj in context.selected_objects:
+        obj.select_set(False)
+
+def deselect_bones(bones):
+    """Deselect all bones or edit bones without an operator"""
+    for bone in bones:
+        bone.select = False
+        bone.select_head = False
+        bone.select_tail = False
+
+def hide_unselected_mesh(obj):
+    """Hide the unselected elements of an edit mesh in the current select mode"""
+    mesh = obj.data
+    bm = bmesh.from_edit_mesh(mesh)
+    if 'VERT' in bm.select_mode:
+        elements = bm.verts
+    elif 'EDGE' in bm.select_mode:
+        elements = bm.edges
+    else:
+        elements = bm.faces
+    
+    # hide_set also hides the connected geometry, like mesh.hide(unselected=True)
+    for element in elements:
+        if not element.select and not element.hide:
+            element.hide_set(True)
+    bmesh.update_edit_mesh(mesh)
+
+def select_mesh_indices(obj, selection, reveal):
+    """Select exactly the stored vertex, edge and face indices of an edit mesh"""
+    mesh = obj.data
+    bm = bmesh.from_edit_mesh(mesh)
+    sequences = ((bm.verts, 'selected_verts'), (bm.edges, 'selected_edges'), (bm.faces, 'selected_faces'))
+    
+    for elements, key in sequences:
+        for element in elements:
+            if reveal:
+                element.hide = False
+            element.select = False
+    
+    for elements, key in sequences:
+        elements.ensure_lookup_table()
+        for index in selection[key]:
+            if index < len(elements):
+                elements[index].select = True
+    bmesh.update_edit_mesh(mesh)
+
 def restore_unhidden_state(self, context, state):
     """Helper function to restore all hidden states"""
     # Restore hidden objects
@@ -60,6 +279,419 @@ def restore_unhidden_state(self, context, state):
     state['hidden_bones'] = []
     state['active'] = False
 
+#----------------------------------------------------------------------------------
+# CURVES, GREASE PENCIL AND LATTICE POINTS
+#----------------------------------------------------------------------------------
+# These modes keep selection and visibility in '.selection'/'.hide' attributes,
+# which are read and written in bulk. State is stored per drawing key: '' for
+# Curves and Lattice, (layer name, frame number) for Grease Pencil drawings.
+# Selected indices are in the selection domain and hidden indices in the domain
+# of the '.hide' attribute, both recorded per key.
+POINT_EDIT_MODES = ('EDIT_CURVES', 'EDIT_GREASE_PENCIL', 'EDIT_LATTICE')
+
+def read_curve_offsets(data):
+    """Read the curve offsets of a Curves or Grease Pencil drawing"""
+    offsets = np.zeros(max(len(data.curve_offsets), 1), dtype=np.int32)
+    if len(data.curve_offsets):
+        data.curve_offsets.foreach_get('value', offsets)
+    return offsets
+
+def domain_size(domain, offsets):
+    """Number of points or curves described by curve offsets"""
+    return int(offsets[-1]) if domain == 'POINT' else len(offsets) - 1
+
+def convert_domain(values, from_domain, to_domain, offsets, combine=np.logical_or):
+    """Convert bool values between the point and curve domains"""
+    if from_domain == to_domain:
+        return values
+    sizes = np.diff(offsets)
+    if to_domain == 'POINT':
+        return np.repeat(values, sizes)
+    
+    # A curve takes the combined value of its points (any by default)
+    result = np.zeros(len(sizes), dtype=bool)
+    filled = sizes > 0
+    if filled.any():
+        result[filled] = combine.reduceat(values, offsets[:-1][filled])
+    return result
+
+def read_bool_attribute(attributes, name, domain, offsets, default, combine=np.logical_or):
+    """Read a boolean (or float) attribute into a bool array on the given domain"""
+    attr = attributes.get(name)
+    if attr is None:
+        return np.full(domain_size(domain, offsets), default, dtype=bool)
+    size = domain_size(attr.domain, offsets)
+    if attr.data_type == 'FLOAT':
+        values = np.empty(size, dtype=np.float32)
+        attr.data.foreach_get('value', values)
+        values = values > 0.0
+    else:
+        values = np.empty(size, dtype=bool)
+        attr.data.foreach_get('value', values)
+    return convert_domain(values, attr.domain, domain, offsets, combine)
+
+def write_bool_attribute(attributes, name, domain, values, offsets, combine=np.logical_or):
+    """Write a bool array to an attribute, converting to the domain it already uses"""
+    attr = attributes.get(name)
+    if attr is None:
+        attr = attributes.new(name, 'BOOLEAN', domain)
+    values = convert_domain(values, domain, attr.domain, offsets, combine)
+    if attr.data_type == 'FLOAT':
+        attr.data.foreach_set('value', values.astype(np.float32))
+    else:
+        attr.data.foreach_set('value', values)
+
+def point_attribute_sources(obj, keys=None):
+    """Return (key, attributes, offsets) of the drawings to isolate, or of the stored keys"""
+    if obj.type == 'CURVES':
+        return [('', obj.data.attributes, read_curve_offsets(obj.data))]
+    
+    sources = []
+    for layer in obj.data.layers:
+        if keys is None:
+            # Isolate the drawing on the current frame of every editable layer
+            frame = layer.current_frame()
+            if layer.hide or layer.lock or frame is None:
+                continue
+            frames = [frame]
+        else:
+            # Restore the exact drawings that were isolated, even if locked or hidden now
+            frames = [frame for frame in layer.frames if (layer.name, frame.frame_number) in keys]
+        for frame in frames:
+            if frame.drawing is not None:
+                sources.append(((layer.name, frame.frame_number), frame.drawing.attributes,
+                                read_curve_offsets(frame.drawing)))
+    return sources
+
+def point_selection_domain(context, obj):
+    """Domain the user currently selects in, point or curve"""
+    if obj.type == 'CURVES':
+        return obj.data.selection_domain
+    select_mode = context.scene.tool_settings.gpencil_selectmode_edit
+    return 'CURVE' if select_mode == 'STROKE' else 'POINT'
+
+def stored_point_keys(mode_state):
+    """Drawing keys recorded in a point mode state"""
+    return set(mode_state['selected']) | set(mode_state['hidden'])
+
+def isolate_point_elements(context, obj, mode, mode_state):
+    """Store the selected points of an object and hide the rest, False if nothing is selected"""
+    if mode == 'EDIT_LATTICE':
+        # Lattice points have no hide flag, only the selection is stored
+        points = obj.data.points
+        select = np.empty(len(points), dtype=bool)
+        points.foreach_get('select', select)
+        if not select.any():
+            return False
+        mode_state['selected'] = {'': np.flatnonzero(select).astype(np.int32)}
+        mode_state['hidden'] = {}
+        mode_state['selection_domains'] = {'': 'POINT'}
+        mode_state['hide_domains'] = {}
+        return True
+    
+    select_domain = point_selection_domain(context, obj)
+    sources = point_attribute_sources(obj)
+    selections = [read_bool_attribute(attributes, '.selection', select_domain, offsets, True)
+                  for key, attributes, offsets in sources]
+    if not any(selection.any() for selection in selections):
+        return False
+    
+    selected = {}
+    hidden = {}
+    selection_domains = {}
+    hide_domains = {}
+    for (key, attributes, offsets), selection in zip(sources, selections):
+        # Hide in the domain existing hide flags use, so they are kept as they are
+        hide_attr = attributes.get('.hide')
+        hide_domain = hide_attr.domain if hide_attr is not None else select_domain
+        keep = convert_domain(selection, select_domain, hide_domain, offsets)
+        hide_flags = read_bool_attribute(attributes, '.hide', hide_domain, offsets, False)
+        to_hide = ~keep & ~hide_flags
+        
+        selected[key] = np.flatnonzero(selection).astype(np.int32)
+        hidden[key] = np.flatnonzero(to_hide).astype(np.int32)
+        selection_domains[key] = select_domain
+        hide_domains[key] = hide_domain
+        if hidden[key].size:
+            write_bool_attribute(attributes, '.hide', hide_domain, hide_flags | to_hide, offsets)
+    
+    mode_state['selected'] = selected
+    mode_state['hidden'] = hidden
+    mode_state['selection_domains'] = selection_domains
+    mode_state['hide_domains'] = hide_domains
+    obj.data.update_tag()
+    return True
+
+def restore_point_elements(context, obj, mode, mode_state, isolated=False):
+    """Reveal (or re-hide when isolated) the stored points and restore their selection"""
+    if mode == 'EDIT_LATTICE':
+        points = obj.data.points
+        select = np.zeros(len(points), dtype=bool)
+        indices = np.asarray(mode_state['selected'].get('', ()), dtype=np.int64)
+        select[indices[indices < len(points)]] = True
+        points.foreach_set('select', select)
+        obj.data.update_tag()
+        return
+    
+    for key, attributes, offsets in point_attribute_sources(obj, stored_point_keys(mode_state)):
+        hidden = np.asarray(mode_state['hidden'].get(key, ()), dtype=np.int64)
+        if hidden.size:
+            # A curve only counts as hidden when all of its points are
+            hide_domain = mode_state['hide_domains'][key]
+            hide_flags = read_bool_attribute(attributes, '.hide', hide_domain, offsets, False, np.logical_and)
+            hide_flags[hidden[hidden < len(hide_flags)]] = isolated
+            write_bool_attribute(attributes, '.hide', hide_domain, hide_flags, offsets, np.logical_and)
+        
+        if key in mode_state['selected']:
+            select_domain = mode_state['selection_domains'][key]
+            selection = np.zeros(domain_size(select_domain, offsets), dtype=bool)
+            selected = np.asarray(mode_state['selected'][key], dtype=np.int64)
+            selection[selected[selected < len(selection)]] = True
+            write_bool_attribute(attributes, '.selection', select_domain, selection, offsets)
+    
+    obj.data.update_tag()
+
+def point_elements_hidden(context, obj, mode_state):
+    """Whether any of the stored hidden points is currently hidden"""
+    for key, attributes, offsets in point_attribute_sources(obj, stored_point_keys(mode_state)):
+        hidden = np.asarray(mode_state['hidden'].get(key, ()), dtype=np.int64)
+        if not hidden.size:
+            continue
+        hide_flags = read_bool_attribute(attributes, '.hide', mode_state['hide_domains'][key],
+                                         offsets, False, np.logical_and)
+        if hide_flags[hidden[hidden < len(hide_flags)]].any():
+            return True
+    return False
+
+#----------------------------------------------------------------------------------
+# ISOLATION UNDO JOURNAL
+#----------------------------------------------------------------------------------
+# Isolation toggles are not global undo steps (in Edit Mode every step copies the
+# whole mesh). Instead each toggle records what it hid and selected, by name or index.
+# The *_isolate_undo operator variants carry the UNDO flag for users who want both.
+isolate_journal = {
+    'undo': [],  # Toggles in the order they happened
+    'redo': [],  # Toggles undone through the journal
+}
+JOURNAL_LIMIT = 64
+
+def object_names(objects):
+    """Names of the objects that still exist"""
+    names = []
+    for obj in objects:
+        try:
+            names.append(obj.name)
+        except ReferenceError:
+            pass
+    return tuple(names)
+
+def make_journal_entry(scope, mode, context, state, mode_state, enabled):
+    """Record the visibility and selection touched by an isolation toggle"""
+    selection = {}
+    for key, values in mode_state.items():
+        if key == 'selected_objects':
+            selection[key] = object_names(values)
+        elif mode == 'EDIT_MESH':
+            selection[key] = np.asarray(values, dtype=np.int32)
+        elif isinstance(values, dict):
+            selection[key] = {name: value if isinstance(value, str) else np.array(value, dtype=np.int32)
+                              for name, value in values.items()}
+        else:
+            selection[key] = tuple(values)
+    
+    return {
+        'scope': scope,
+        'mode': mode,
+        'enabled': enabled,  # Whether the toggle turned isolation on
+        'object': context.object.name if mode != 'OBJECT' and context.object else None,
+        'objects': object_names(state['hidden_objects']),
+        'bones': tuple(state['hidden_bones']),
+        'selection': selection,
+    }
+
+def record_isolation_toggle(entry):
+    """Add a toggle to the journal"""
+    isolate_journal['undo'].append(entry)
+    del isolate_journal['undo'][:-JOURNAL_LIMIT]
+    isolate_journal['redo'].clear()
+
+def isolate_operator_idname(context, scope):
+    """Operator for a scope, its UNDO variant when full undo steps are enabled"""
+    idname = "view3d.local_isolate" if scope == 'LOCAL' else "view3d.global_isolate"
+    try:
+        if context.preferences.addons[__name__].preferences.push_global_undo:
+            idname += "_undo"
+    except KeyError:
+        pass
+    return idname
+
+def sync_state_from_entry(entry, isolated):
+    """Make the stored isolation state match a journal entry"""
+    state = isolate_states[entry['scope']]
+    mode_state = state[entry['mode']]
+    
+    # Resolve by name, undo may have replaced the datablocks
+    if isolated:
+        state['hidden_objects'] = [bpy.data.objects[name] for name in entry['objects']
+                                   if name in bpy.data.objects]
+        state['hidden_bones'] = list(entry['bones'])
+    else:
+        state['hidden_objects'] = []
+        state['hidden_bones'] = []
+    
+    for key, values in entry['selection'].items():
+        if key == 'selected_objects':
+            mode_state[key] = [bpy.data.objects[name] for name in values if name in bpy.data.objects]
+        elif isinstance(values, dict):
+            mode_state[key] = {name: value.copy() if isinstance(value, np.ndarray) else value
+                               for name, value in values.items()}
+        else:
+            mode_state[key] = list(values.tolist() if isinstance(values, np.ndarray) else values)
+    
+    state['active'] = isolated
+
+def journal_entry_applied(entry):
+    """Whether the visibility recorded in an entry is currently in effect"""
+    for name in entry['objects']:
+        obj = bpy.data.objects.get(name)
+        if obj is not None and obj.hide_viewport:
+            return True
+    
+    obj = bpy.data.objects.get(entry['object']) if entry['object'] else None
+    if obj is None:
+        return False
+    
+    if entry['mode'] in ('POSE', 'EDIT_ARMATURE') and obj.type == 'ARMATURE':
+        bones = obj.data.edit_bones if obj.mode == 'EDIT' else obj.data.bones
+        return any(bones[name].hide for name in entry['bones'] if name in bones)
+    
+    if entry['mode'] == 'EDIT_MESH' and obj.type == 'MESH' and obj.mode == 'EDIT':
+        # Only the vertices this toggle hid count, not ones hidden before isolating
+        hidden = np.asarray(entry['selection'].get('hidden_verts', ()), dtype=np.int64)
+        if not hidden.size:
+            return False
+        # Read the edit BMesh directly, stopping at the first hidden vertex
+        bm = bmesh.from_edit_mesh(obj.data)
+        bm.verts.ensure_lookup_table()
+        return any(bm.verts[index].hide for index in hidden.tolist() if index < len(bm.verts))
+    
+    if entry['mode'] in POINT_EDIT_MODES and obj.mode == 'EDIT' and entry['mode'] != 'EDIT_LATTICE':
+        return point_elements_hidden(bpy.context, obj, entry['selection'])
+    
+    return False
+
+def apply_journal_entry(context, entry, isolated):
+    """Re-apply (isolated=True) or revert (isolated=False) a recorded toggle"""
+    mode = entry['mode']
+    selection = entry['selection']
+    obj = bpy.data.objects.get(entry['object']) if entry['object'] else None
+    
+    for name in entry['objects']:
+        scene_obj = bpy.data.objects.get(name)
+        if scene_obj is not None:
+            scene_obj.hide_viewport = isolated
+    
+    if mode == 'OBJECT':
+        deselect_objects(context)
+        selected = [bpy.data.objects[name] for name in selection['selected_objects']
+                    if name in bpy.data.objects]
+        for scene_obj in selected:
+            scene_obj.select_set(True)
+        if selected:
+            context.view_layer.objects.active = selected[0]
+    
+    elif mode == 'EDIT_MESH':
+        select_mesh_indices(obj, selection, reveal=not isolated)
+        if isolated:
+            hide_unselected_mesh(obj)
+    
+    elif mode == 'POSE':
+        bones = obj.data.bones
+        for name in entry['bones']:
+            if name in bones:
+                bones[name].hide = isolated
+        
+        deselect_bones(bones)
+        for name in selection['selected_bones']:
+            if name in bones:
+                bones[name].select = True
+    
+    elif mode == 'EDIT_ARMATURE':
+        bones = obj.data.edit_bones
+        for name in entry['bones']:
+            if name in bones:
+                bones[name].hide = isolated
+        
+        deselect_bones(bones)
+        for name in selection['selected_bones']:
+            if name in bones:
+                bones[name].select = True
+                bones[name].select_head = True
+                bones[name].select_tail = True
+    
+    elif mode in POINT_EDIT_MODES:
+        restore_point_elements(context, obj, mode, selection, isolated)
+    
+    sync_state_from_entry(entry, isolated)
+
+@persistent
+def journal_undo_post(scene, *args):
+    """Keep the isolation state consistent after a Blender undo or redo"""
+    for scope in ('LOCAL', 'GLOBAL'):
+        entries = [entry for entry in isolate_journal['undo'] if entry['scope'] == scope]
+        if not entries:
+            continue
+        
+        # The undo step may have restored visibility from before or after the toggle
+        entry = entries[-1]
+        sync_state_from_entry(entry, journal_entry_applied(entry))
+
+def step_isolation_journal(self, context, source, target, undo):
+    """Move the latest toggle from one journal stack to the other and apply it"""
+    entry = source[-1]
+    if entry['mode'] != context.mode:
+        self.report({'WARNING'}, f"Switch to {entry['mode']} to change this isolation")
+        return {'CANCELLED'}
+    if entry['object'] and (context.object is None or context.object.name != entry['object']):
+        self.report({'WARNING'}, f"Isolation was recorded on '{entry['object']}'")
+        return {'CANCELLED'}
+    
+    source.pop()
+    apply_journal_entry(context, entry, entry['enabled'] != undo)
+    target.append(entry)
+    
+    for area in context.screen.areas:
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
+    
+    return {'FINISHED'}
+
+class ISOLATE_OT_journal_undo(Operator):
+    """Undo the last isolation toggle without a full undo step"""
+    bl_idname = "isolate.journal_undo"
+    bl_label = "Undo Isolation"
+    bl_options = {'REGISTER'}
+    
+    @classmethod
+    def poll(cls, context):
+        return bool(isolate_journal['undo'])
+    
+    def execute(self, context):
+        return step_isolation_journal(self, context, isolate_journal['undo'], isolate_journal['redo'], True)
+
+class ISOLATE_OT_journal_redo(Operator):
+    """Redo the last isolation toggle undone with Undo Isolation"""
+    bl_idname = "isolate.journal_redo"
+    bl_label = "Redo Isolation"
+    bl_options = {'REGISTER'}
+    
+    @classmethod
+    def poll(cls, context):
+        return bool(isolate_journal['redo'])
+    
+    def execute(self, context):
+        return step_isolation_journal(self, context, isolate_journal['redo'], isolate_journal['undo'], False)
+
 #----------------------------------------------------------------------------------
 # LOCAL ISOLATION OPERATOR
 #----------------------------------------------------------------------------------
@@ -67,7 +699,7 @@ class VIEW3D_OT_local_isolate(Operator):
     """Toggle isolation of selected elements within the current object"""
     bl_idname = "view3d.local_isolate"
     bl_label = "Local Isolate Select"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_options = {'REGISTER'}
     
     @classmethod
     def poll(cls, context):
@@ -80,6 +712,9 @@ class VIEW3D_OT_local_isolate(Operator):
     def execute(self, context):
         mode = context.mode
         state = isolate_states['LOCAL']
+        if mode not in state:
+            self.report({'WARNING'}, f"Isolation is not supported in {mode}")
+            return {'CANCELLED'}
         mode_state = state[mode]
         
         if not state['active']:
@@ -104,14 +739,9 @@ class VIEW3D_OT_local_isolate(Operator):
             # EDIT MESH MODE
             elif mode == 'EDIT_MESH':
                 obj = context.edit_object
-                mesh = obj.data
-                bm = bmesh.from_edit_mesh(mesh)
-                
-                mode_state['selected_verts'] = [v.index for v in bm.verts if v.select]
-                mode_state['selected_edges'] = [e.index for e in bm.edges if e.select]
-                mode_state['selected_faces'] = [f.index for f in bm.faces if f.select]
+                store_mesh_selection(obj, mode_state)
                 
-                bpy.ops.mesh.hide(unselected=True)
+                hide_unselected_mesh(obj)
                 
             # POSE MODE
             elif mode == 'POSE':
@@ -151,16 +781,28 @@ class VIEW3D_OT_local_isolate(Operator):
                 
                 state['hidden_bones'] = hidden_bones
             
+            # CURVES, GREASE PENCIL AND LATTICE EDIT MODES
+            elif mode in POINT_EDIT_MODES:
+                if mode == 'EDIT_LATTICE':
+                    self.report({'WARNING'}, "Lattice points cannot be hidden, use global isolation")
+                    return {'CANCELLED'}
+                if not isolate_point_elements(context, context.object, mode, mode_state):
+                    self.report({'WARNING'}, "No points selected")
+                    return {'CANCELLED'}
+            
+            entry = make_journal_entry('LOCAL', mode, context, state, mode_state, True)
             state['active'] = True
             self.report({'INFO'}, f"Local isolate mode enabled ({mode})")
             
         else:
+            entry = make_journal_entry('LOCAL', mode, context, state, mode_state, False)
+            
             # Call helper function to restore all hidden states
             restore_unhidden_state(self, context, state)
             
             # Restore mode-specific selections
             if mode == 'OBJECT':
-                bpy.ops.object.select_all(action='DESELECT')
+                deselect_objects(context)
                 if 'selected_objects' in mode_state:
                     for obj in mode_state['selected_objects'][:]:
                         try:
@@ -178,29 +820,7 @@ class VIEW3D_OT_local_isolate(Operator):
             
             elif mode == 'EDIT_MESH':
                 obj = context.edit_object
-                mesh = obj.data
-                
-                bpy.ops.mesh.reveal()
-                bpy.ops.mesh.select_all(action='DESELECT')
-                
-                bm = bmesh.from_edit_mesh(mesh)
-                
-                if mode_state['selected_verts']:
-                    for index in mode_state['selected_verts']:
-                        if index < len(bm.verts):
-                            bm.verts[index].select = True
-                
-                if mode_state['selected_edges']:
-                    for index in mode_state['selected_edges']:
-                        if index < len(bm.edges):
-                            bm.edges[index].select = True
-                
-                if mode_state['selected_faces']:
-                    for index in mode_state['selected_faces']:
-                        if index < len(bm.faces):
-                            bm.faces[index].select = True
-                
-                bmesh.update_edit_mesh(mesh)
+                select_mesh_indices(obj, mode_state, reveal=True)
             
             elif mode == 'POSE':
                 armature = context.object
@@ -209,7 +829,7 @@ class VIEW3D_OT_local_isolate(Operator):
                 for bone in armature.data.bones:
                     bone.hide = False
                 
-                bpy.ops.pose.select_all(action='DESELECT')
+                deselect_bones(armature.data.bones)
                 
                 if mode_state['selected_bones']:
                     for bone_name in mode_state['selected_bones']:
@@ -223,7 +843,7 @@ class VIEW3D_OT_local_isolate(Operator):
                 for bone in armature.data.edit_bones:
                     bone.hide = False
                 
-                bpy.ops.armature.select_all(action='DESELECT')
+                deselect_bones(armature.data.edit_bones)
                 
                 if mode_state['selected_bones']:
                     for bone_name in mode_state['selected_bones']:
@@ -232,8 +852,13 @@ class VIEW3D_OT_local_isolate(Operator):
                             armature.data.edit_bones[bone_name].select_head = True
                             armature.data.edit_bones[bone_name].select_tail = True
             
+            elif mode in POINT_EDIT_MODES:
+                restore_point_elements(context, context.object, mode, mode_state)
+            
             self.report({'INFO'}, f"Local isolate mode disabled ({mode})")
         
+        record_isolation_toggle(entry)
+        
         # Force viewport update
         for area in context.screen.areas:
             if area.type == 'VIEW_3D':
@@ -241,6 +866,11 @@ class VIEW3D_OT_local_isolate(Operator):
         
         return {'FINISHED'}
 
+class VIEW3D_OT_local_isolate_undo(VIEW3D_OT_local_isolate):
+    """Toggle isolation of selected elements within the current object, as a full undo step"""
+    bl_idname = "view3d.local_isolate_undo"
+    bl_options = {'REGISTER', 'UNDO'}
+
 #----------------------------------------------------------------------------------
 # GLOBAL ISOLATION OPERATOR
 #----------------------------------------------------------------------------------
@@ -248,7 +878,7 @@ class VIEW3D_OT_global_isolate(Operator):
     """Toggle isolation of selected elements and hide everything else in the scene"""
     bl_idname = "view3d.global_isolate"
     bl_label = "Global Isolate Select"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_options = {'REGISTER'}
     
     @classmethod
     def poll(cls, context):
@@ -261,6 +891,9 @@ class VIEW3D_OT_global_isolate(Operator):
     def execute(self, context):
         mode = context.mode
         state = isolate_states['GLOBAL']
+        if mode not in state:
+            self.report({'WARNING'}, f"Isolation is not supported in {mode}")
+            return {'CANCELLED'}
         mode_state = state[mode]
         
         if not state['active']:
@@ -285,14 +918,9 @@ class VIEW3D_OT_global_isolate(Operator):
             # EDIT MESH MODE
             elif mode == 'EDIT_MESH':
                 obj = context.edit_object
-                mesh = obj.data
-                bm = bmesh.from_edit_mesh(mesh)
+                store_mesh_selection(obj, mode_state)
                 
-                mode_state['selected_verts'] = [v.index for v in bm.verts if v.select]
-                mode_state['selected_edges'] = [e.index for e in bm.edges if e.select]
-                mode_state['selected_faces'] = [f.index for f in bm.faces if f.select]
-                
-                bpy.ops.mesh.hide(unselected=True)
+                hide_unselected_mesh(obj)
                 
                 # Hide other objects
                 hidden = []
@@ -359,16 +987,35 @@ class VIEW3D_OT_global_isolate(Operator):
                 
                 state['hidden_objects'] = hidden
             
+            # CURVES, GREASE PENCIL AND LATTICE EDIT MODES
+            elif mode in POINT_EDIT_MODES:
+                obj = context.object
+                if not isolate_point_elements(context, obj, mode, mode_state):
+                    self.report({'WARNING'}, "No points selected")
+                    return {'CANCELLED'}
+                
+                # Hide other objects
+                hidden = []
+                for scene_obj in context.view_layer.objects:
+                    if scene_obj != obj and not scene_obj.hide_viewport:
+                        hidden.append(scene_obj)
+                        scene_obj.hide_viewport = True
+                
+                state['hidden_objects'] = hidden
+            
+            entry = make_journal_entry('GLOBAL', mode, context, state, mode_state, True)
             state['active'] = True
             self.report({'INFO'}, f"Global isolate mode enabled ({mode})")
             
         else:
+            entry = make_journal_entry('GLOBAL', mode, context, state, mode_state, False)
+            
             # Call helper function to restore all hidden states
             restore_unhidden_state(self, context, state)
             
             # Restore mode-specific selections
             if mode == 'OBJECT':
-                bpy.ops.object.select_all(action='DESELECT')
+                deselect_objects(context)
                 if 'selected_objects' in mode_state:
                     for obj in mode_state['selected_objects'][:]:
                         try:
@@ -386,29 +1033,7 @@ class VIEW3D_OT_global_isolate(Operator):
             
             elif mode == 'EDIT_MESH':
                 obj = context.edit_object
-                mesh = obj.data
-                
-                bpy.ops.mesh.reveal()
-                bpy.ops.mesh.select_all(action='DESELECT')
-                
-                bm = bmesh.from_edit_mesh(mesh)
-                
-                if mode_state['selected_verts']:
-                    for index in mode_state['selected_verts']:
-                        if index < len(bm.verts):
-                            bm.verts[index].select = True
-                
-                if mode_state['selected_edges']:
-                    for index in mode_state['selected_edges']:
-                        if index < len(bm.edges):
-                            bm.edges[index].select = True
-                
-                if mode_state['selected_faces']:
-                    for index in mode_state['selected_faces']:
-                        if index < len(bm.faces):
-                            bm.faces[index].select = True
-                
-                bmesh.update_edit_mesh(mesh)
+                select_mesh_indices(obj, mode_state, reveal=True)
             
             elif mode == 'POSE':
                 armature = context.object
@@ -417,7 +1042,7 @@ class VIEW3D_OT_global_isolate(Operator):
                 for bone in armature.data.bones:
                     bone.hide = False
                 
-                bpy.ops.pose.select_all(action='DESELECT')
+                deselect_bones(armature.data.bones)
                 
                 if mode_state['selected_bones']:
                     for bone_name in mode_state['selected_bones']:
@@ -431,7 +1056,7 @@ class VIEW3D_OT_global_isolate(Operator):
                 for bone in armature.data.edit_bones:
                     bone.hide = False
                 
-                bpy.ops.armature.select_all(action='DESELECT')
+                deselect_bones(armature.data.edit_bones)
                 
                 if mode_state['selected_bones']:
                     for bone_name in mode_state['selected_bones']:
@@ -440,8 +1065,13 @@ class VIEW3D_OT_global_isolate(Operator):
                             armature.data.edit_bones[bone_name].select_head = True
                             armature.data.edit_bones[bone_name].select_tail = True
             
+            elif mode in POINT_EDIT_MODES:
+                restore_point_elements(context, context.object, mode, mode_state)
+            
             self.report({'INFO'}, f"Global isolate mode disabled ({mode})")
         
+        record_isolation_toggle(entry)
+        
         # Force viewport update
         for area in context.screen.areas:
             if area.type == 'VIEW_3D':
@@ -449,6 +1079,388 @@ class VIEW3D_OT_global_isolate(Operator):
         
         return {'FINISHED'}
 
+class VIEW3D_OT_global_isolate_undo(VIEW3D_OT_global_isolate):
+    """Toggle isolation of selected elements and hide everything else, as a full undo step"""
+    bl_idname = "view3d.global_isolate_undo"
+    bl_options = {'REGISTER', 'UNDO'}
+
+#----------------------------------------------------------------------------------
+# PYTHON API
+#----------------------------------------------------------------------------------
+# Context-free isolation for scripts. Works directly on data blocks with
+# foreach_get/foreach_set, so no VIEW_3D context or bpy.ops calls are needed.
+#
+#     handle = isolate_select.isolate(objects=assets)
+#     ...
+#     isolate_select.restore(handle)
+
+def read_hide(collection):
+    """Read the hide flags of a mesh or bone collection into a bool array"""
+    hide = np.empty(len(collection), dtype=bool)
+    collection.foreach_get('hide', hide)
+    return hide
+
+def keep_mask(keep, count):
+    """Turn indices or a bool mask into a bool mask of the given length"""
+    keep = np.asarray(keep)
+    if keep.dtype == bool:
+        if len(keep) != count:
+            raise ValueError(f"Element mask has {len(keep)} entries, expected {count}")
+        return keep
+    mask = np.zeros(count, dtype=bool)
+    indices = keep.astype(np.int64).ravel()
+    mask[indices[(indices >= 0) & (indices < count)]] = True
+    return mask
+
+def isolate_mesh_elements(mesh, keep):
+    """Hide every vertex outside keep and the edges and faces using it, return the old flags
+    
+    Object Mode ignores mesh hide flags, they take effect when the mesh enters Edit Mode.
+    """
+    previous = (read_hide(mesh.vertices), read_hide(mesh.edges), read_hide(mesh.polygons))
+    
+    vert_hide = previous[0] | ~keep_mask(keep, len(mesh.vertices))
+    
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edge_verts)
+    edge_hide = previous[1] | vert_hide[edge_verts].reshape(-1, 2).any(axis=1)
+    
+    face_hide = previous[2].copy()
+    if len(mesh.polygons):
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.loops.foreach_get('vertex_index', loop_verts)
+        mesh.polygons.foreach_get('loop_start', loop_start)
+        face_hide |= np.logical_or.reduceat(vert_hide[loop_verts], loop_start)
+    
+    mesh.vertices.foreach_set('hide', vert_hide)
+    mesh.edges.foreach_set('hide', edge_hide)
+    mesh.polygons.foreach_set('hide', face_hide)
+    mesh.update()
+    return previous
+
+def isolate_bones(armature, keep):
+    """Hide every bone whose name is not in keep, return the old flags"""
+    bones = armature.bones
+    previous = read_hide(bones)
+    keep = set(keep)
+    bone_hide = previous | np.array([bone.name not in keep for bone in bones], dtype=bool)
+    bones.foreach_set('hide', bone_hide)
+    return previous
+
+def isolate(objects=(), elements=None, mode='OBJECT', scope='GLOBAL', view_layer=None):
+    """Isolate objects or elements of many objects in one call
+    
+    objects: objects to keep visible.
+    elements: dict mapping mesh objects to the vertex indices (or a bool mask) to keep,
+              and armature objects to the bone names to keep. Objects sharing
+              data keep the union of their elements. Mesh hide flags only show
+              once the mesh enters Edit Mode, bone hide flags show right away.
+    mode: 'OBJECT' isolates whole objects, 'ELEMENTS' isolates the given elements.
+    scope: 'LOCAL' only touches the given objects' elements, 'GLOBAL' also hides every
+           other object. Object isolation always hides the other objects.
+    
+    Returns a handle describing what changed, to pass to restore().
+    """
+    if mode not in ('OBJECT', 'ELEMENTS'):
+        raise ValueError(f"Unknown isolation mode '{mode}'")
+    if scope not in ('LOCAL', 'GLOBAL'):
+        raise ValueError(f"Unknown isolation scope '{scope}'")
+    
+    elements = elements or {}
+    view_layer = view_layer or bpy.context.view_layer
+    keep = set(objects) | set(elements)
+    
+    # Validate the whole batch before touching any data, merging the elements
+    # of objects that share a mesh or armature
+    mesh_keeps = {}
+    armature_keeps = {}
+    if mode == 'ELEMENTS':
+        for obj, keep_elements in elements.items():
+            data = obj.data
+            if obj.type == 'MESH':
+                if data.is_editmode:
+                    raise ValueError(f"Mesh '{data.name}' is in Edit Mode")
+                mask = keep_mask(keep_elements, len(data.vertices))
+                mesh_keeps[data] = mesh_keeps[data] | mask if data in mesh_keeps else mask
+            elif obj.type == 'ARMATURE':
+                if data.is_editmode:
+                    raise ValueError(f"Armature '{data.name}' is in Edit Mode")
+                armature_keeps.setdefault(data, set()).update(keep_elements)
+            else:
+                raise ValueError(f"Cannot isolate elements of {obj.type.lower()} '{obj.name}'")
+    
+    handle = {
+        'mode': mode,
+        'scope': scope,
+        'hidden_objects': [],  # Object names hidden by this call
+        'meshes': {},          # Mesh name -> previous (vertex, edge, face) hide flags
+        'armatures': {},       # Armature name -> previous bone hide flags
+    }
+    
+    for mesh, mask in mesh_keeps.items():
+        handle['meshes'][mesh.name] = isolate_mesh_elements(mesh, mask)
+    for armature, names in armature_keeps.items():
+        handle['armatures'][armature.name] = isolate_bones(armature, names)
+    
+    if mode == 'OBJECT' or scope == 'GLOBAL':
+        for obj in view_layer.objects:
+            if obj not in keep and not obj.hide_viewport:
+                obj.hide_viewport = True
+                handle['hidden_objects'].append(obj.name)
+    
+    return handle
+
+def restore(handle):
+    """Undo an isolate() call using the handle it returned"""
+    for name in handle['hidden_objects']:
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            obj.hide_viewport = False
+    
+    for name, (vert_hide, edge_hide, face_hide) in handle['meshes'].items():
+        mesh = bpy.data.meshes.get(name)
+        if mesh is None or mesh.is_editmode:
+            continue
+        if (len(mesh.vertices), len(mesh.edges), len(mesh.polygons)) != (len(vert_hide), len(edge_hide), len(face_hide)):
+            continue
+        mesh.vertices.foreach_set('hide', vert_hide)
+        mesh.edges.foreach_set('hide', edge_hide)
+        mesh.polygons.foreach_set('hide', face_hide)
+        mesh.update()
+    
+    for name, bone_hide in handle['armatures'].items():
+        armature = bpy.data.armatures.get(name)
+        if armature is not None and not armature.is_editmode and len(armature.bones) == len(bone_hide):
+            armature.bones.foreach_set('hide', bone_hide)
+    
+    handle['hidden_objects'] = []
+    handle['meshes'] = {}
+    handle['armatures'] = {}
+
+#----------------------------------------------------------------------------------
+# PLAYBACK ISOLATION
+#----------------------------------------------------------------------------------
+playback_state = {
+    'active': False,       # A playback session is being tracked
+    'isolated': False,     # Objects are currently hidden for playback
+    'handle': None,        # isolate() handle of the objects hidden for playback
+    'frame_times': [],     # Timestamps of the frames played in the current phase
+    'fps_before': None,    # Measured fps before isolation
+    'fps_after': None,     # Measured fps after isolation
+    'rehide': False,       # Isolation was lifted for a save and must be re-applied
+}
+
+def playback_prefs():
+    """Addon preferences, or None when the file is run as a script"""
+    try:
+        return bpy.context.preferences.addons[__name__].preferences
+    except KeyError:
+        return None
+
+def measure_fps(frame_times):
+    """Average fps over a list of frame timestamps"""
+    if len(frame_times) < 2:
+        return None
+    elapsed = frame_times[-1] - frame_times[0]
+    if elapsed <= 0.0:
+        return None
+    return (len(frame_times) - 1) / elapsed
+
+def struct_dependencies(struct):
+    """Objects and collections referenced by a modifier or constraint"""
+    found = []
+    
+    # Every pointer property: Shrinkwrap target, Mirror mirror_object, Array caps,
+    # Boolean collection, constraint targets and so on
+    for prop in struct.bl_rna.properties:
+        if prop.type == 'POINTER':
+            found.append(getattr(struct, prop.identifier, None))
+    
+    # Armature constraint targets
+    if isinstance(struct, bpy.types.Constraint) and hasattr(struct, 'targets'):
+        for target in struct.targets:
+            found.append(target.target)
+    
+    # Geometry Nodes object and collection inputs are ID properties
+    try:
+        for key in struct.keys():
+            found.append(struct[key])
+    except TypeError:
+        pass
+    return found
+
+def collect_playback_objects(seeds):
+    """Return the seed objects, their children and everything they depend on"""
+    keep = set()
+    stack = []
+    for obj in seeds:
+        stack.append(obj)
+        stack.extend(obj.children_recursive)
+    
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, bpy.types.Collection):
+            stack.extend(obj.all_objects)
+            continue
+        if not isinstance(obj, bpy.types.Object) or obj in keep:
+            continue
+        keep.add(obj)
+        
+        # Parents and everything modifiers and constraints point at
+        stack.append(obj.parent)
+        for mod in obj.modifiers:
+            stack.extend(struct_dependencies(mod))
+        for con in obj.constraints:
+            stack.extend(struct_dependencies(con))
+        
+        # Objects read by drivers
+        if obj.animation_data:
+            for fcurve in obj.animation_data.drivers:
+                for var in fcurve.driver.variables:
+                    for target in var.targets:
+                        stack.append(target.id)
+    return keep
+
+def playback_seeds(context):
+    """Objects playback keeps: the active isolation, otherwise the selection"""
+    for scope in ('GLOBAL', 'LOCAL'):
+        state = isolate_states[scope]
+        if not state['active']:
+            continue
+        if context.mode == 'OBJECT':
+            names = object_names(state['OBJECT']['selected_objects'])
+            return {bpy.data.objects[name] for name in names if name in bpy.data.objects}
+        if context.object:
+            return {context.object}
+    
+    seeds = set(context.selected_objects)
+    if context.object:
+        seeds.add(context.object)
+    return seeds
+
+def hide_for_playback(context):
+    """Disable every object outside the isolated set and its dependencies"""
+    seeds = playback_seeds(context)
+    if not seeds:
+        # Nothing to isolate, hiding everything would only blank the viewport
+        playback_state['active'] = False
+        return False
+    
+    keep = collect_playback_objects(seeds)
+    if context.scene.camera is not None:
+        keep.add(context.scene.camera)
+    
+    # hide_viewport removes objects from viewport evaluation, not just drawing
+    playback_state['handle'] = isolate(objects=keep, view_layer=context.view_layer)
+    playback_state['isolated'] = True
+    return True
+
+def restore_after_playback():
+    """Re-enable the objects hidden for playback"""
+    if playback_state['handle'] is not None:
+        restore(playback_state['handle'])
+    
+    playback_state['handle'] = None
+    playback_state['isolated'] = False
+
+@persistent
+def playback_start(scene, *args):
+    """Start tracking a playback session"""
+    prefs = playback_prefs()
+    if prefs is None or not prefs.enable_playback_isolate:
+        return
+    
+    playback_state['active'] = True
+    playback_state['frame_times'] = []
+    playback_state['fps_before'] = None
+    playback_state['fps_after'] = None
+    
+    # Without sample frames there is nothing to measure, isolate right away
+    if prefs.playback_sample_frames == 0:
+        hide_for_playback(bpy.context)
+
+@persistent
+def playback_frame_change(scene, *args):
+    """Time played frames and isolate once the unisolated fps has been sampled"""
+    if not playback_state['active']:
+        return
+    
+    now = time.perf_counter()
+    playback_state['frame_times'].append(now)
+    
+    if not playback_state['isolated']:
+        prefs = playback_prefs()
+        if prefs is None:
+            return
+        if len(playback_state['frame_times']) > prefs.playback_sample_frames:
+            playback_state['fps_before'] = measure_fps(playback_state['frame_times'])
+            playback_state['frame_times'] = [now]
+            hide_for_playback(bpy.context)
+
+@persistent
+def playback_stop(scene, *args):
+    """Restore everything hidden for playback and store the measured fps"""
+    if not playback_state['active']:
+        return
+    
+    fps = measure_fps(playback_state['frame_times'])
+    if playback_state['isolated']:
+        playback_state['fps_after'] = fps
+        restore_after_playback()
+    else:
+        playback_state['fps_before'] = fps
+    
+    playback_state['frame_times'] = []
+    playback_state['active'] = False
+    
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+@persistent
+def playback_load_pre(*args):
+    """End the playback session before another file replaces the current one"""
+    if playback_state['isolated']:
+        restore_after_playback()
+    playback_state['frame_times'] = []
+    playback_state['rehide'] = False
+    playback_state['active'] = False
+
+@persistent
+def playback_save_pre(*args):
+    """Lift playback isolation so hidden objects are not saved disabled"""
+    if playback_state['isolated']:
+        restore_after_playback()
+        playback_state['rehide'] = True
+
+@persistent
+def playback_save_post(*args):
+    """Re-apply playback isolation lifted for the save"""
+    if playback_state['rehide'] and playback_state['active']:
+        hide_for_playback(bpy.context)
+    playback_state['rehide'] = False
+
+@persistent
+def playback_undo_post(*args):
+    """Re-apply playback isolation to the data restored by an undo or redo"""
+    if not playback_state['isolated']:
+        return
+    
+    # The restored step may have been pushed during playback with objects still
+    # disabled, so the old handle's objects stay in the new one
+    old_handle = playback_state['handle']
+    playback_state['handle'] = None
+    if hide_for_playback(bpy.context) and old_handle is not None:
+        hidden = playback_state['handle']['hidden_objects']
+        hidden.extend(name for name in old_handle['hidden_objects'] if name not in hidden)
+    else:
+        # Nothing to seed from any more, keep the old session so playback_stop restores it
+        playback_state['handle'] = old_handle
+        playback_state['isolated'] = True
+        playback_state['active'] = True
+
 #----------------------------------------------------------------------------------
 # HOTKEY UPDATE OPERATOR
 #----------------------------------------------------------------------------------
@@ -489,6 +1501,26 @@ class IsolateSelectPreferences(AddonPreferences):
         default=True
     )
     
+    push_global_undo: BoolProperty(
+        name="Push Full Undo Steps",
+        description="Use isolate operators that push a global undo step (copies the whole mesh in Edit Mode). Apply Hotkey Settings to update the shortcuts",
+        default=False
+    )
+    
+    enable_playback_isolate: BoolProperty(
+        name="Isolate During Playback",
+        description="Disable everything outside the selection and its dependencies while the animation plays",
+        default=False
+    )
+    
+    playback_sample_frames: IntProperty(
+        name="Sample Frames",
+        description="Frames played without isolation to measure the fps before isolating",
+        default=24,
+        min=0,
+        max=240
+    )
+    
     # Local isolate hotkey settings
     local_key_type: EnumProperty(
         name="Hotkey",
@@ -598,6 +1630,11 @@ class IsolateSelectPreferences(AddonPreferences):
         row = box.row()
         row.prop(self, "enable_local_isolate")
         row.prop(self, "enable_global_isolate")
+        row = box.row()
+        row.prop(self, "push_global_undo")
+        row = box.row()
+        row.prop(self, "enable_playback_isolate")
+        row.prop(self, "playback_sample_frames")
         
         # Local isolate hotkey settings
         box = layout.box()
@@ -641,14 +1678,14 @@ class VIEW3D_PT_isolate_select(Panel):
         
         # Only show enabled operators
         if prefs.enable_local_isolate:
-            col.operator("view3d.local_isolate", text="Toggle Local Isolation", icon='HIDE_OFF')
+            col.operator(isolate_operator_idname(context, 'LOCAL'), text="Toggle Local Isolation", icon='HIDE_OFF')
         
         if prefs.enable_global_isolate:
-            col.operator("view3d.global_isolate", text="Toggle Global Isolation", icon='WORLD')
+            col.operator(isolate_operator_idname(context, 'GLOBAL'), text="Toggle Global Isolation", icon='WORLD')
         
         # Show current state
         mode = context.mode
-        if mode in ['OBJECT', 'EDIT_MESH', 'POSE', 'EDIT_ARMATURE']:
+        if mode in ['OBJECT', 'EDIT_MESH', 'POSE', 'EDIT_ARMATURE', *POINT_EDIT_MODES]:
             box = layout.box()
             col = box.column()
             
@@ -667,6 +1704,23 @@ class VIEW3D_PT_isolate_select(Panel):
                     col.label(text="Global Isolation: Active", icon='CHECKMARK')
                 else:
                     col.label(text="Global Isolation: Inactive", icon='X')
+            
+            row = box.row(align=True)
+            row.operator("isolate.journal_undo", text="Undo Isolation", icon='LOOP_BACK')
+            row.operator("isolate.journal_redo", text="Redo Isolation", icon='LOOP_FORWARDS')
+        
+        # Playback isolation and its fps report
+        box = layout.box()
+        col = box.column()
+        col.prop(prefs, "enable_playback_isolate")
+        if prefs.enable_playback_isolate:
+            col.prop(prefs, "playback_sample_frames")
+            for label, fps in (("Before", playback_state['fps_before']),
+                               ("After", playback_state['fps_after'])):
+                if fps is None:
+                    col.label(text=f"{label} Isolation: -- fps")
+                else:
+                    col.label(text=f"{label} Isolation: {fps:.1f} fps")
 
 #----------------------------------------------------------------------------------
 # MENU ITEMS
@@ -678,10 +1732,17 @@ def draw_items(self, context):
     layout.separator()
     
     if prefs.enable_local_isolate:
-        layout.operator("view3d.local_isolate", text="Toggle Local Isolation")
+        layout.operator(isolate_operator_idname(context, 'LOCAL'), text="Toggle Local Isolation")
     
     if prefs.enable_global_isolate:
-        layout.operator("view3d.global_isolate", text="Toggle Global Isolation")
+        layout.operator(isolate_operator_idname(context, 'GLOBAL'), text="Toggle Global Isolation")
+
+# Edit context menus of the point modes, missing ones are skipped on older Blender versions
+POINT_CONTEXT_MENUS = (
+    'VIEW3D_MT_edit_curves_context_menu',
+    'VIEW3D_MT_greasepencil_edit_context_menu',
+    'VIEW3D_MT_edit_lattice_context_menu',
+)
 
 #----------------------------------------------------------------------------------
 # KEYMAPS
@@ -696,12 +1757,13 @@ def setup_keymaps():
         prefs = bpy.context.preferences.addons[__name__].preferences
         
         # Set up keymaps for all relevant modes
-        for mode_name in ['Object Mode', 'Mesh', 'Pose', 'Armature']:
+        for mode_name in ['Object Mode', 'Mesh', 'Pose', 'Armature',
+                          'Curves', 'Grease Pencil Edit Mode', 'Lattice']:
             # Local isolate keymaps (only if enabled)
             if prefs.enable_local_isolate:
                 km = kc.keymaps.new(name=mode_name)
                 kmi = km.keymap_items.new(
-                    "view3d.local_isolate",
+                    isolate_operator_idname(bpy.context, 'LOCAL'),
                     type=prefs.local_key_type,
                     value='PRESS',
                     shift=prefs.local_use_shift,
@@ -714,7 +1776,7 @@ def setup_keymaps():
             if prefs.enable_global_isolate:
                 km = kc.keymaps.new(name=mode_name)
                 kmi = km.keymap_items.new(
-                    "view3d.global_isolate",
+                    isolate_operator_idname(bpy.context, 'GLOBAL'),
                     type=prefs.global_key_type,
                     value='PRESS',
                     shift=prefs.global_use_shift,
@@ -727,10 +1789,28 @@ def setup_keymaps():
 # REGISTRATION
 #----------------------------------------------------------------------------------
 def register():
+    global index_pool
+    index_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="isolate_index")
+    bpy.app.handlers.depsgraph_update_post.append(index_depsgraph_update)
+    bpy.app.handlers.animation_playback_pre.append(playback_start)
+    bpy.app.handlers.frame_change_pre.append(playback_frame_change)
+    bpy.app.handlers.animation_playback_post.append(playback_stop)
+    bpy.app.handlers.load_pre.append(playback_load_pre)
+    bpy.app.handlers.save_pre.append(playback_save_pre)
+    bpy.app.handlers.save_post.append(playback_save_post)
+    bpy.app.handlers.undo_post.append(playback_undo_post)
+    bpy.app.handlers.redo_post.append(playback_undo_post)
+    bpy.app.handlers.undo_post.append(journal_undo_post)
+    bpy.app.handlers.redo_post.append(journal_undo_post)
+    
     bpy.utils.register_class(ISOLATE_OT_update_hotkeys)
     bpy.utils.register_class(IsolateSelectPreferences)
     bpy.utils.register_class(VIEW3D_OT_local_isolate)
     bpy.utils.register_class(VIEW3D_OT_global_isolate)
+    bpy.utils.register_class(VIEW3D_OT_local_isolate_undo)
+    bpy.utils.register_class(VIEW3D_OT_global_isolate_undo)
+    bpy.utils.register_class(ISOLATE_OT_journal_undo)
+    bpy.utils.register_class(ISOLATE_OT_journal_redo)
     bpy.utils.register_class(VIEW3D_PT_isolate_select)
     
     # Add to context menus
@@ -738,6 +1818,10 @@ def register():
     bpy.types.VIEW3D_MT_edit_mesh_context_menu.append(draw_items)
     bpy.types.VIEW3D_MT_armature_context_menu.append(draw_items)
     bpy.types.VIEW3D_MT_pose_context_menu.append(draw_items)
+    for menu_name in POINT_CONTEXT_MENUS:
+        menu = getattr(bpy.types, menu_name, None)
+        if menu is not None:
+            menu.append(draw_items)
     
     # Setup keymaps
     setup_keymaps()
@@ -748,6 +1832,10 @@ def unregister():
     bpy.types.VIEW3D_MT_edit_mesh_context_menu.remove(draw_items)
     bpy.types.VIEW3D_MT_armature_context_menu.remove(draw_items)
     bpy.types.VIEW3D_MT_pose_context_menu.remove(draw_items)
+    for menu_name in POINT_CONTEXT_MENUS:
+        menu = getattr(bpy.types, menu_name, None)
+        if menu is not None:
+            menu.remove(draw_items)
     
     # Remove keymaps
     for km, kmi in addon_keymaps:
@@ -755,10 +1843,51 @@ def unregister():
     addon_keymaps.clear()
     
     bpy.utils.unregister_class(VIEW3D_PT_isolate_select)
+    bpy.utils.unregister_class(ISOLATE_OT_journal_redo)
+    bpy.utils.unregister_class(ISOLATE_OT_journal_undo)
+    bpy.utils.unregister_class(VIEW3D_OT_global_isolate_undo)
+    bpy.utils.unregister_class(VIEW3D_OT_local_isolate_undo)
     bpy.utils.unregister_class(VIEW3D_OT_global_isolate)
     bpy.utils.unregister_class(VIEW3D_OT_local_isolate)
     bpy.utils.unregister_class(IsolateSelectPreferences)
     bpy.utils.unregister_class(ISOLATE_OT_update_hotkeys)
+    
+    # Drop the isolation journal
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if journal_undo_post in handlers:
+            handlers.remove(journal_undo_post)
+    isolate_journal['undo'].clear()
+    isolate_journal['redo'].clear()
+    
+    # Stop playback isolation
+    if playback_state['isolated']:
+        restore_after_playback()
+    playback_state['active'] = False
+    for handlers, handler in ((bpy.app.handlers.animation_playback_pre, playback_start),
+                              (bpy.app.handlers.frame_change_pre, playback_frame_change),
+                              (bpy.app.handlers.animation_playback_post, playback_stop),
+                              (bpy.app.handlers.load_pre, playback_load_pre),
+                              (bpy.app.handlers.save_pre, playback_save_pre),
+                              (bpy.app.handlers.save_post, playback_save_post),
+                              (bpy.app.handlers.undo_post, playback_undo_post),
+                              (bpy.app.handlers.redo_post, playback_undo_post)):
+        if handler in handlers:
+            handlers.remove(handler)
+    
+    # Stop background indexing
+    global index_pool
+    if index_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(index_depsgraph_update)
+    if bpy.app.timers.is_registered(snapshot_dirty_indexes):
+        bpy.app.timers.unregister(snapshot_dirty_indexes)
+    if index_pool is not None:
+        index_pool.shutdown(wait=False, cancel_futures=True)
+        index_pool = None
+    isolate_indexes.clear()
+    index_generations.clear()
+    dirty_indexes.clear()
+    index_watched.clear()
+    index_self_updates.clear()
 
 if __name__ == "__main__":
     register()
\ No newline at end of file